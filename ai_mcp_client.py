@@ -8,32 +8,71 @@ with real LLM calls using Groq.
 Usage:
     export GROQ_API_KEY=your_api_key_here
     python ai_mcp_demo.py
+
+Interactive Usage (VS Code Interactive, Jupyter, etc.):
+    await ai_mcp_client_demo()
 """
 
-import os
 import asyncio
-import json
-from groq import Groq
+import orjson
 from fastmcp import Client
+from llm_clients import GROQ_API_KEY, close_async_groq, get_async_groq
+
+
+# Upper bound on user requests processed at once (LLM call + MCP tool call)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Byte-stable system message built once at import, so the provider can reuse the
+# cached prompt prefix across calls
+SYSTEM_PROMPT = ("You are an AI assistant that can call tools to help users. "
+                 "Based on the user query, call the single most appropriate tool "
+                 "with the parameters it needs.")
+
 
+def _compact_tool_desc(tool):
+    """First line of the tool's docstring - name and parameters are already in the schema"""
+    return (tool.description or "").strip().split("\n", 1)[0]
 
-# Set up Groq API key (you'll need to set this)
-GROQ_API_KEY = os.getenv('GROQ_API_KEY') or "your-groq-api-key-here"
-groq_client = Groq(api_key=GROQ_API_KEY)
 
+def mcp_tools_to_openai_schema(tools):
+    """Convert MCP tools to the OpenAI/Groq function-calling `tools=` format"""
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": _compact_tool_desc(tool),
+                # Newer fastmcp renamed inputSchema to input_schema (the old name warns)
+                "parameters": getattr(tool, "input_schema", None) or tool.inputSchema
+            }
+        }
+        for tool in tools
+    ]
 
-async def ai_mcp_client_demo():
-    """Demonstrate AI application using MCP protocol with actual LLM calls"""
+
+async def ai_mcp_client_demo(mcp_client=None):
+    """Demonstrate AI application using MCP protocol with actual LLM calls
+
+    Args:
+        mcp_client (Client): Optional already-created MCP client to reuse. Callers
+            that run the demo repeatedly can keep one session open around the calls
+            instead of reconnecting each time (the client context is re-entrant).
+    """
     print("🤖 AI + MCP CLIENT DEMO (Real LLM Integration)")
     print("=" * 50)
     
+    # Shared pooled Groq client for LLM calls, fetched per run so a client closed by
+    # close_async_groq() is never reused
+    groq_client = get_async_groq()
+    
     # Connect to MCP server
     # MCP Client URL Options based on server transport:
-    # - SSE (current):           Client("http://localhost:8765/sse")
+    # - SSE:                     Client("http://localhost:8765/sse")
     # - HTTP:                    Client("http://localhost:8765")
-    # - Streamable HTTP:         Client("http://localhost:8765/stream")
+    # - Streamable HTTP (current): Client("http://localhost:8765/mcp")
     # - STDIO:                   Client("mcp_server.py") - simple file path syntax
-    mcp_client = Client("http://localhost:8765/sse")
+    if mcp_client is None:
+        mcp_client = Client("http://localhost:8765/mcp")
     async with mcp_client:
         # Get available tools from MCP server
         print("\n📋 AI discovering tools via MCP...")
@@ -55,57 +94,59 @@ async def ai_mcp_client_demo():
         
         print("\n🎯 AI processing user requests using LLM + MCP tools:")
         
-        for user_input in user_requests:
-            print(f"\n👤 User: {user_input}")
-            
-            # Create prompt for LLM to choose the right tool - Use tools directly as strings
-            tools_str = "\n\n".join(str(tool) for tool in tools)
-            prompt = f"""You are an AI assistant that can call tools to help users. 
-                        Available tools:
-                        {tools_str}
-
-                        User query: "{user_input}"
+        # Tool schemas go through the native tools= API and are converted only once
+        tool_schemas = mcp_tools_to_openai_schema(tools)
 
-                        Based on the user query, determine which tool to use and what parameters to provide.
-                        Respond with ONLY a JSON object in this format:
-                        {{
-                            "tool_name": "tool_name_here",
-                            "parameters": {{"param1": "value1", "param2": "value2"}}
-                        }}
+        async def process_one(user_input):
+            """Let the LLM pick a tool for one request and run it via MCP
+            
+            Returns the lines to print, so concurrent requests don't interleave output.
+            """
+            out = [f"\n👤 User: {user_input}"]
 
-                        Do not include any other text in your response."""
+            # Only the user query changes between requests
+            messages = [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": 'User query: "' + user_input + '"'}
+            ]
 
             try:
                 # Call LLM to decide which tool to use
-                print("🧠 Asking LLM to choose the right tool...")
+                out.append("🧠 Asking LLM to choose the right tool...")
                 
                 if GROQ_API_KEY != "your-groq-api-key-here":
-                    chat_completion = groq_client.chat.completions.create(
-                        messages=[{"role": "user", "content": prompt}],
+                    chat_completion = await groq_client.chat.completions.create(
+                        messages=messages,
                         model="llama-3.1-8b-instant",
-                        temperature=0.1
+                        temperature=0.1,
+                        tools=tool_schemas,
+                        tool_choice="auto"
                     )
                     
-                    llm_response = (chat_completion.choices[0].message.content or "").strip()
-                    print(f"🧠 LLM response: {llm_response}")
+                    message = chat_completion.choices[0].message
+                    if not message.tool_calls:
+                        out.append(f"❌ LLM did not choose a tool: {message.content}")
+                        return out
+                    
+                    tool_call = message.tool_calls[0]
+                    tool_name = tool_call.function.name
+                    out.append(f"🧠 LLM tool call: {tool_name}({tool_call.function.arguments})")
                     
-                    # Parse LLM response
+                    # Tool-call arguments arrive as a JSON string matching the tool's schema
                     try:
-                        tool_choice = json.loads(llm_response)
-                        tool_name = tool_choice["tool_name"]
-                        parameters = tool_choice["parameters"]
+                        parameters = orjson.loads(tool_call.function.arguments or "{}")
                         
-                        print(f"🤖 AI selected: {tool_name} with parameters {parameters}")
+                        out.append(f"🤖 AI selected: {tool_name} with parameters {parameters}")
                         
                         # Call the chosen tool via MCP
                         result = await mcp_client.call_tool(tool_name, parameters)
-                        print(f"   Result: {result.structured_content}")
+                        out.append(f"   Result: {result.structured_content}")
                         
-                    except json.JSONDecodeError:
-                        print("❌ Failed to parse LLM response as JSON")
+                    except orjson.JSONDecodeError:
+                        out.append("❌ Failed to parse LLM tool arguments as JSON")
                 else:
                     # Fallback simulation when no API key
-                    print("⚠️  No Groq API key - simulating LLM response...")
+                    out.append("⚠️  No Groq API key - simulating LLM response...")
                     tool_choice = None
                     if "weather" in user_input.lower():
                         tool_choice = {"tool_name": "get_weather", "parameters": {"city": "Tokyo"}}
@@ -115,14 +156,28 @@ async def ai_mcp_client_demo():
                         tool_choice = {"tool_name": "get_user_info", "parameters": {"user_id": 2}}
                     
                     if tool_choice:
-                        print(f"🤖 Simulated AI choice: {tool_choice['tool_name']} with parameters {tool_choice['parameters']}")
+                        out.append(f"🤖 Simulated AI choice: {tool_choice['tool_name']} with parameters {tool_choice['parameters']}")
                         result = await mcp_client.call_tool(tool_choice["tool_name"], tool_choice["parameters"])
-                        print(f"   Result: {result.structured_content}")
+                        out.append(f"   Result: {result.structured_content}")
                     else:
-                        print("❌ Could not determine appropriate tool for query")
+                        out.append("❌ Could not determine appropriate tool for query")
                     
             except Exception as e:
-                print(f"❌ Error in LLM call or tool execution: {e}")
+                out.append(f"❌ Error in LLM call or tool execution: {e}")
+            return out
+        
+        # Issue the LLM tool-selection calls concurrently; the semaphore caps in-flight
+        # LLM + MCP pairs to stay under rate limits
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def bounded(user_input):
+            async with semaphore:
+                return await process_one(user_input)
+
+        # gather returns results in request order - print each request's output as a block
+        outputs = await asyncio.gather(*[bounded(user_input) for user_input in user_requests])
+        for lines in outputs:
+            print("\n".join(lines))
         
         print("\n✅ AI + MCP demo completed!")
         print("💡 Key insight: LLM chooses tools dynamically based on user query and MCP tool schemas")
@@ -136,19 +191,19 @@ def main():
     print("Set GROQ_API_KEY environment variable for real LLM calls")
     print("   Or demo will run in simulation mode")
     print()
-    asyncio.run(ai_mcp_client_demo())
-
-
-# Check for interactive environment FIRST, before the __name__ check
-try:
-    # Check if we're in an interactive environment with a running event loop
-    loop = asyncio.get_running_loop()
-    if loop and loop.is_running():
-        print("VS Code Interactive mode detected!")
-        print("Running AI + MCP demo...")
-        # Use create_task to run in the existing event loop
-        demo_task = asyncio.create_task(ai_mcp_client_demo())
-except RuntimeError:
-    # No event loop running - safe to use the standard script approach
-    if __name__ == "__main__":
-        main()
\ No newline at end of file
+
+    async def run():
+        # Hold one MCP session open for the whole run and hand it to the demo
+        mcp_client = Client("http://localhost:8765/mcp")
+        try:
+            async with mcp_client:
+                await ai_mcp_client_demo(mcp_client)
+        finally:
+            # Close the pooled connections while the event loop is still running
+            await close_async_groq()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,42 +2,56 @@
 """
 Traditional Function Calling Demo - AI with Direct Function Calls
 
-This demonstrate    print("TRADITIONAL FUNCTION CALLING DEMO (Real LLM Integration)")
-    print("=" * 65)
-    
-    # Show available functions
-    function_schemas = create_function_schema_from_mcp_tools()
-    
-    print(f"\nUsing actual functions from mcp_server.py:")
-    for name in ["get_weather", "calculate", "get_user_info"]:
-        print(f"  - {name}")
-    
-    print(f"\nGenerated {len(function_schemas)} function schemas dynamically")
-    print("Schemas created from function signatures & docstrings")
-    
-    # Show function schemas
-    print(f"\nFUNCTION CALLING SCHEMAS:")
-    print("=" * 35)nction calling where we import the actual functions 
+This demonstrates traditional function calling where we import the actual functions 
 from the MCP server and use them directly (without the @mcp.tool decorator effect).
 
 Usage:
     export GROQ_API_KEY=your_api_key_here
     python function_calling_demo.py
+
+Interactive Usage (VS Code Interactive, Jupyter, etc.):
+    function_calling_demo()
 """
 
-import json
-import inspect
-import os
-from groq import Groq
+import functools
+import orjson
+from types import MappingProxyType
+from llm_clients import GROQ_API_KEY, get_groq
 
 
 # Groq client for LLM calls
-GROQ_API_KEY = os.getenv('GROQ_API_KEY') or "your-groq-api-key-here"
-groq_client = Groq(api_key=GROQ_API_KEY)
+groq_client = get_groq()
+
+# Static parts of the system prompt, built once at import; only the function
+# schemas are spliced in between them
+_PROMPT_HEAD = """You are an AI assistant that can call functions to help users.
+Available function schemas: """
+_PROMPT_TAIL = """
+
+Based on the user query, determine which function to call and what parameters to provide.
+Respond with ONLY a JSON object in this format:
+{
+    "function_name": "function_name_here",
+    "parameters": {"param1": "value1", "param2": "value2"}
+}
+"function_name" must be one of the available function names and "parameters" must
+match that function's parameters schema.
 
+Do not include any other text in your response."""
 
+# JSON schema type for each supported Python parameter annotation
+_PARAM_TYPE = {int: "integer", float: "number", str: "string"}
+
+
+@functools.lru_cache(maxsize=1)
 def create_function_schema_from_mcp_tools():
-    """Create function calling schemas dynamically from MCP server tools"""
+    """Create function calling schemas dynamically from MCP server tools
+
+    The result only depends on the functions defined below, so it is built once
+    and cached. The returned tuple and mapping can't be changed, but the schema
+    dicts inside the tuple are the cached objects themselves - copy a schema
+    before modifying it, or every later call sees the change.
+    """
     # Define the actual functions (not the MCP decorated versions)
     def get_weather_func(city: str) -> dict:
         """Get weather information for a city."""
@@ -78,30 +92,22 @@ def create_function_schema_from_mcp_tools():
     
     schemas = []
     for func_name, func in mcp_functions.items():
-        # Get function signature and docstring
-        sig = inspect.signature(func)
+        # Read parameter names, annotations and defaults straight off the function
+        # object - no inspect.Signature objects needed
+        code = func.__code__
+        param_names = code.co_varnames[:code.co_argcount]
+        annotations = getattr(func, "__annotations__", {})
+        n_required = len(param_names) - len(func.__defaults__ or ())
         doc = func.__doc__ or f"Function {func_name}"
         
         # Build parameters schema from function signature
         properties = {}
-        required = []
-        
-        for param_name, param in sig.parameters.items():
-            param_type = "string"  # default
-            if param.annotation == int:
-                param_type = "integer"
-            elif param.annotation == float:
-                param_type = "number"
-            elif param.annotation == str:
-                param_type = "string"
-            
+        for param_name in param_names:
             properties[param_name] = {
-                "type": param_type,
+                "type": _PARAM_TYPE.get(annotations.get(param_name), "string"),
                 "description": f"The {param_name} parameter"
             }
-            
-            if param.default == inspect.Parameter.empty:
-                required.append(param_name)
+        required = list(param_names[:n_required])
         
         schema = {
             "type": "function",
@@ -117,7 +123,11 @@ def create_function_schema_from_mcp_tools():
         }
         schemas.append(schema)
     
-    return schemas, mcp_functions
+    return tuple(schemas), MappingProxyType(mcp_functions)
+
+
+# Schemas and callables are built once at import time
+FUNCTION_SCHEMAS, AVAILABLE_FUNCTIONS = create_function_schema_from_mcp_tools()
 
 
 def function_calling_demo():
@@ -125,8 +135,8 @@ def function_calling_demo():
     print("TRADITIONAL FUNCTION CALLING DEMO (Real LLM Integration)")
     print("=" * 65)
     
-    # Generate schemas from actual MCP server functions
-    function_schemas, available_functions = create_function_schema_from_mcp_tools()
+    # Schemas generated from actual MCP server functions at import time
+    function_schemas, available_functions = FUNCTION_SCHEMAS, AVAILABLE_FUNCTIONS
     
     print(f"\nUsing actual functions from mcp_server.py:")
     for func_name in available_functions.keys():
@@ -151,7 +161,7 @@ def function_calling_demo():
     
     # Show one complete example schema
     print(f"\nComplete JSON Schema Example (get_weather):")
-    print(json.dumps(function_schemas[0], indent=2))
+    print(orjson.dumps(function_schemas[0], option=orjson.OPT_INDENT_2).decode())
     
     # Simulate user requests with LLM integration
     user_requests = [
@@ -163,23 +173,20 @@ def function_calling_demo():
     print(f"\nEXECUTING FUNCTION CALLS WITH LLM:")
     print("=" * 40)
     
+    # Function schemas + response format go in a byte-stable system message so the
+    # provider can reuse the cached prefix (sorted keys keep the serialization stable).
+    # Compact output: indentation whitespace would only cost prompt tokens
+    functions_list = orjson.dumps(function_schemas, option=orjson.OPT_SORT_KEYS).decode()
+    system_prompt = _PROMPT_HEAD + functions_list + _PROMPT_TAIL
+    
     for user_input in user_requests:
         print(f"\nUser: {user_input}")
         
-        # Create prompt for LLM with function schemas directly
-        prompt = f"""You are an AI assistant that can call functions to help users.
-                    Available function schemas: {json.dumps(function_schemas, indent=2)}
-
-                    User query: "{user_input}"
-
-                    Based on the user query, determine which function to call and what parameters to provide.
-                    Respond with ONLY a JSON object in this format:
-                    {{
-                        "function_name": "function_name_here",
-                        "parameters": {{"param1": "value1", "param2": "value2"}}
-                    }}
-
-                    Do not include any other text in your response."""
+        # Only the user query changes between requests
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": 'User query: "' + user_input + '"'}
+        ]
 
         try:
             # Call LLM to decide which function to use
@@ -187,39 +194,38 @@ def function_calling_demo():
             
             if GROQ_API_KEY != "your-groq-api-key-here":
                 chat_completion = groq_client.chat.completions.create(
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=messages,
                     model="llama-3.1-8b-instant",
-                    temperature=0.1
+                    temperature=0.1,
+                    # JSON mode: the server guarantees a parseable JSON object
+                    response_format={"type": "json_object"}
                 )
                 
-                llm_response = (chat_completion.choices[0].message.content or "").strip()
+                # JSON mode output needs no .strip() - orjson skips surrounding whitespace
+                message = chat_completion.choices[0].message
+                llm_response = message.content or ""
                 print(f"LLM response: {llm_response}")
                 
                 # Parse LLM response
                 try:
-                    function_choice = json.loads(llm_response)
+                    function_choice = orjson.loads(llm_response)
                     function_name = function_choice["function_name"]
                     parameters = function_choice["parameters"]
                     
                     print(f"AI selected: {function_name} with parameters {parameters}")
                     
                     # Call the chosen function directly
-                    result = None
-                    if function_name in available_functions:
-                        if function_name == "get_weather":
-                            result = available_functions[function_name](parameters["city"])
-                        elif function_name == "calculate":
-                            result = available_functions[function_name](
-                                parameters["operation"], 
-                                parameters["a"], 
-                                parameters["b"]
-                            )
-                        elif function_name == "get_user_info":
-                            # Fix: Convert string user_id to integer if needed
-                            user_id = parameters["user_id"]
-                            if isinstance(user_id, str) and user_id.isdigit():
-                                user_id = int(user_id)
-                            result = available_functions[function_name](user_id)
+                    fn = available_functions.get(function_name)
+                    if fn:
+                        # Fix: LLMs sometimes send integer arguments (e.g. user_id) as
+                        # strings - coerce only parameters annotated as int
+                        annotations = fn.__annotations__
+                        parameters = {
+                            name: int(value) if (annotations.get(name) is int and isinstance(value, str)
+                                                 and value.isdigit()) else value
+                            for name, value in parameters.items()
+                        }
+                        result = fn(**parameters)
                         
                         if result is not None:
                             print(f"   Result: {result}")
@@ -228,7 +234,7 @@ def function_calling_demo():
                     else:
                         print(f"Unknown function: {function_name}")
                         
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     print("Failed to parse LLM response as JSON")
             else:
                 # Fallback simulation when no API key
@@ -246,21 +252,8 @@ def function_calling_demo():
                     print(f"Simulated AI choice: {function_choice['function_name']} with parameters {function_choice['parameters']}")
                     
                     # Execute the simulated choice
-                    result = None
-                    if function_choice["function_name"] == "get_weather":
-                        result = available_functions["get_weather"](function_choice["parameters"]["city"])
-                    elif function_choice["function_name"] == "calculate":
-                        result = available_functions["calculate"](
-                            function_choice["parameters"]["operation"],
-                            function_choice["parameters"]["a"],
-                            function_choice["parameters"]["b"]
-                        )
-                    elif function_choice["function_name"] == "get_user_info":
-                        # Fix: Convert user_id to integer if needed
-                        user_id = function_choice["parameters"]["user_id"]
-                        if isinstance(user_id, str) and str(user_id).isdigit():
-                            user_id = int(user_id)
-                        result = available_functions["get_user_info"](user_id)
+                    fn = available_functions.get(function_choice["function_name"])
+                    result = fn(**function_choice["parameters"]) if fn else None
                     
                     if result is not None:
                         print(f"   Result: {result}")
@@ -289,17 +282,5 @@ def main():
     function_calling_demo()
 
 
-# Check for interactive environment FIRST, before the __name__ check
-try:
-    # Check if we're in an interactive environment with a running event loop
-    import asyncio
-    loop = asyncio.get_running_loop()
-    if loop and loop.is_running():
-        print("VS Code Interactive mode detected!")
-        print("Running Function Calling demo...")
-        # Function calling demo is synchronous, so we can run it directly
-        function_calling_demo()
-except RuntimeError:
-    # No event loop running - safe to use the standard script approach
-    if __name__ == "__main__":
-        main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Shared LLM clients for the demo modules
+
+Every demo that talks to Groq gets its client from here, so importing several
+demos together (e.g. in a notebook) creates one connection pool per client type
+instead of one per module.
+
+Usage:
+    from llm_clients import GROQ_API_KEY, get_async_groq, close_async_groq
+    groq_client = get_async_groq()
+    ...
+    await close_async_groq()
+"""
+
+import functools
+import os
+import httpx
+from groq import AsyncGroq, Groq
+
+
+# Set up Groq API key (you'll need to set this)
+GROQ_API_KEY = os.getenv('GROQ_API_KEY') or "your-groq-api-key-here"
+
+
+@functools.lru_cache(maxsize=1)
+def get_groq():
+    """Return the shared synchronous Groq client (created on first use)"""
+    return Groq(api_key=GROQ_API_KEY)
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_groq():
+    """Return the shared AsyncGroq client (created on first use)
+
+    One pooled HTTP/2 client serves every LLM call, so concurrent requests reuse
+    warm connections instead of paying TCP/TLS setup each time.
+    """
+    return AsyncGroq(
+        api_key=GROQ_API_KEY,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=True
+        )
+    )
+
+
+async def close_async_groq():
+    """Close the shared AsyncGroq client, if one was created
+
+    The cache is cleared as well, so a later get_async_groq() call builds a fresh
+    client instead of handing out the closed one.
+    """
+    if get_async_groq.cache_info().currsize:
+        await get_async_groq().close()
+        get_async_groq.cache_clear()
@@ -2,24 +2,62 @@
 from fastmcp import FastMCP
 import sys
 import os
-import psutil
 import time
-import requests
-import socket
+
+# psutil and socket are only needed by the server-management helpers
+# below, so they are imported inside those functions: a stdio server (e.g. one
+# spawned by an agent) skips those helpers and never pays their import cost
 
 mcp = FastMCP(name="DemoMCPServer")
 
+# Static demo data, built once at import instead of on every tool/resource call
+# Simulated weather data
+_WEATHER_DATA = {
+    "New York": {"temperature": 22, "condition": "sunny", "humidity": 65},
+    "London": {"temperature": 15, "condition": "cloudy", "humidity": 80},
+    "Tokyo": {"temperature": 28, "condition": "rainy", "humidity": 90}
+}
+
+_USERS = {
+    1: {"name": "Alice", "email": "alice@example.com", "role": "admin"},
+    2: {"name": "Bob", "email": "bob@example.com", "role": "user"},
+    3: {"name": "Charlie", "email": "charlie@example.com", "role": "manager"}
+}
+
+_SERVER_CONFIG = {
+    "name": "DemoMCPServer",
+    "version": "1.0.0",
+    "tools_count": 3,
+    "resources_count": 3,
+    "prompts_count": 2,
+    "supported_transports": ["sse", "http", "streamable-http", "stdio"]
+}
+
+_SAMPLE_DATA = {
+    "users": ["Alice", "Bob", "Charlie"],
+    "cities": ["New York", "London", "Tokyo"],
+    "operations": ["add", "subtract", "multiply", "divide"],
+    "timestamp": "2025-09-19T12:00:00Z"
+}
+
+_TOOL_HELP = {
+    "get_weather": "Use get_weather(city) to get weather info for New York, London, or Tokyo",
+    "calculate": "Use calculate(operation, a, b) with operations: add, subtract, multiply, divide",
+    "get_user_info": "Use get_user_info(user_id) with IDs 1, 2, or 3 to get user details",
+    "all": "Available tools: get_weather, calculate, get_user_info. Each tool has specific parameters."
+}
+
+# Messages for lookup misses - only formatted when a key is actually missing
+_WEATHER_MISSING = "Weather data not available for %s"
+_USER_MISSING = "User %s not found"
+_TOOL_MISSING = "No help available for tool: %s"
+
 # Simple tools for demonstration
 @mcp.tool
 def get_weather(city: str) -> dict: ##Get Weather
     """Get weather information for a city."""
-    # Simulated weather data
-    weather_data = {
-        "New York": {"temperature": 22, "condition": "sunny", "humidity": 65},
-        "London": {"temperature": 15, "condition": "cloudy", "humidity": 80},
-        "Tokyo": {"temperature": 28, "condition": "rainy", "humidity": 90}
-    }
-    return weather_data.get(city, {"error": f"Weather data not available for {city}"})
+    weather = _WEATHER_DATA.get(city)
+    return weather if weather is not None else {"error": _WEATHER_MISSING % city}
 
 @mcp.tool
 def calculate(operation: str, a: float, b: float) -> dict:
@@ -36,12 +74,8 @@ def calculate(operation: str, a: float, b: float) -> dict:
 @mcp.tool
 def get_user_info(user_id: int) -> dict:
     """Get user information by ID."""
-    users = {
-        1: {"name": "Alice", "email": "alice@example.com", "role": "admin"},
-        2: {"name": "Bob", "email": "bob@example.com", "role": "user"}, 
-        3: {"name": "Charlie", "email": "charlie@example.com", "role": "manager"}
-    }
-    return users.get(user_id, {"error": f"User {user_id} not found"})
+    user = _USERS.get(user_id)
+    return user if user is not None else {"error": _USER_MISSING % user_id}
 
 # Simple resources for demonstration
 @mcp.resource("demo://docs/welcome")
@@ -61,24 +95,12 @@ Available tools: get_weather, calculate, get_user_info
 @mcp.resource("demo://config/server")
 def server_config() -> dict:
     """Server configuration information."""
-    return {
-        "name": "DemoMCPServer",
-        "version": "1.0.0",
-        "tools_count": 3,
-        "resources_count": 3,
-        "prompts_count": 2,
-        "supported_transports": ["sse", "http", "streamable-http", "stdio"]
-    }
+    return _SERVER_CONFIG
 
 @mcp.resource("demo://data/sample")
 def sample_data() -> dict:
     """Sample data for demonstration."""
-    return {
-        "users": ["Alice", "Bob", "Charlie"],
-        "cities": ["New York", "London", "Tokyo"],
-        "operations": ["add", "subtract", "multiply", "divide"],
-        "timestamp": "2025-09-19T12:00:00Z"
-    }
+    return _SAMPLE_DATA
 
 # Simple prompts for demonstration
 @mcp.prompt
@@ -89,107 +111,222 @@ def greeting(name: str = "User") -> str:
 @mcp.prompt  
 def tool_help(tool_name: str = "all") -> str:
     """Provide help information for tools."""
-    help_text = {
-        "get_weather": "Use get_weather(city) to get weather info for New York, London, or Tokyo",
-        "calculate": "Use calculate(operation, a, b) with operations: add, subtract, multiply, divide", 
-        "get_user_info": "Use get_user_info(user_id) with IDs 1, 2, or 3 to get user details",
-        "all": "Available tools: get_weather, calculate, get_user_info. Each tool has specific parameters."
-    }
-    return help_text.get(tool_name, f"No help available for tool: {tool_name}")
+    help_text = _TOOL_HELP.get(tool_name)
+    return help_text if help_text is not None else _TOOL_MISSING % tool_name
 
 # Utility functions for MCP server management
+def _http_responds(port, path="/mcp", timeout=0.5):
+    """Return True if an HTTP server on localhost:<port> answers GET <path> at all
+    
+    Uses http.client instead of requests: a plain local GET needs no TLS, redirects
+    or cookies, and this keeps requests (and its dependencies) out of the module.
+    """
+    import http.client
+    conn = http.client.HTTPConnection("localhost", port, timeout=timeout)
+    try:
+        conn.request("GET", path)
+        conn.getresponse()
+        return True
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        conn.close()
+
 def is_port_in_use(port, host='localhost'):
     """Check if a port is already in use"""
+    import socket
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(1)
-            result = sock.connect_ex((host, port))
-            return result == 0
+            # A refused port fails immediately, and a slow or filtered host costs at
+            # most 100ms instead of 1s; the socket timeout handles the pending connect
+            # portably (Windows reports it as WSAEWOULDBLOCK, not EINPROGRESS)
+            sock.settimeout(0.1)
+            return sock.connect_ex((host, port)) == 0
     except Exception:
         return False
 
-def is_mcp_server_running(port=8765):
-    """Check if MCP server is running on the specified port by testing the MCP endpoint"""
+def is_mcp_server_running(port=8765, ttl=0):
+    """Check if MCP server is running on the specified port
+    
+    A TCP connect tells us the port is bound; the process that owns the port must
+    then be one of our MCP server processes rather than something else using it.
+    
+    Args:
+        port (int): Port to check
+        ttl (float): Passed to find_mcp_server_processes - lets a caller that has
+            just scanned reuse that scan
+    """
+    if not is_port_in_use(port):
+        return False
+    owner_pid = _find_port_pid(port)
+    if owner_pid is None:
+        return False
+    return any(proc.pid == owner_pid for proc in find_mcp_server_processes(ttl=ttl))
+
+def _find_port_pid(port):
+    """Return the PID of the process using <port>, or None if it can't be determined"""
+    import psutil
     try:
-        # Test the SSE endpoint which is the default for MCP
-        response = requests.get(f"http://localhost:{port}/sse", timeout=2)
-        # MCP SSE endpoint should return something, even if it's an error about missing headers
-        return True
-    except requests.RequestException:
+        # One system-wide socket table read instead of per-process connection scans
+        return next((conn.pid for conn in psutil.net_connections(kind='inet')
+                     if conn.laddr and conn.laddr.port == port and conn.pid), None)
+    except psutil.AccessDenied:
+        # macOS only lets root read the system-wide table; fall back to asking each
+        # process we are allowed to inspect (at least the user's own)
+        pass
+    for proc in psutil.process_iter():
         try:
-            # Also test HTTP endpoint as fallback
-            response = requests.get(f"http://localhost:{port}", timeout=2)
-            return True
-        except requests.RequestException:
-            return False
+            for conn in proc.net_connections(kind='inet'):
+                if conn.laddr and conn.laddr.port == port:
+                    return proc.pid
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return None
 
 def get_port_info(port):
     """Get information about what's running on a port"""
+    import psutil
     if not is_port_in_use(port):
         return None
     
     try:
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            try:
-                for conn in proc.connections():
-                    if conn.laddr.port == port:
-                        return {
-                            'pid': proc.info['pid'],
-                            'name': proc.info['name'],
-                            'cmdline': ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else 'N/A'
-                        }
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        pid = _find_port_pid(port)
+        if pid is not None:
+            proc = psutil.Process(pid)
+            with proc.oneshot():
+                cmdline = proc.cmdline()
+                return {
+                    'pid': pid,
+                    'name': proc.name(),
+                    'cmdline': ' '.join(cmdline) if cmdline else 'N/A'
+                }
     except Exception:
         pass
     
     return {'pid': 'Unknown', 'name': 'Unknown', 'cmdline': 'Unknown process using port'}
 
-def find_mcp_server_processes():
-    """Find running MCP server processes"""
-    mcp_processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+def _is_mcp_server_cmdline(cmdline):
+    """Check whether an argv list is a Python interpreter running mcp_server.py"""
+    if not cmdline or len(cmdline) < 2:
+        return False
+    # Cheap interpreter check first - most processes are not Python at all. Only the
+    # executable name counts, not directories like ~/python-projects/ in its path
+    if 'python' not in os.path.basename(cmdline[0]):
+        return False
+    return any('mcp_server.py' in arg for arg in cmdline[1:])
+
+def _find_mcp_server_pids_linux():
+    """Find MCP server PIDs by reading /proc/<pid>/cmdline directly (Linux only)"""
+    pids = []
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
         try:
-            if proc.info['cmdline'] and len(proc.info['cmdline']) > 1:
-                cmdline = ' '.join(proc.info['cmdline'])
-                if 'mcp_server.py' in cmdline and 'python' in cmdline:
-                    mcp_processes.append(proc)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            with open(f'/proc/{name}/cmdline', 'rb') as f:
+                data = f.read()
+        except OSError:
             continue
-    return mcp_processes
+        # Reject the vast majority of processes before splitting the cmdline
+        if b'mcp_server.py' not in data:
+            continue
+        cmdline = [os.fsdecode(arg) for arg in data.rstrip(b'\0').split(b'\0')]
+        if _is_mcp_server_cmdline(cmdline):
+            pids.append(int(name))
+    return pids
+
+# Last process-table scan as (monotonic timestamp, processes); only reused by
+# callers that pass a ttl, e.g. the back-to-back checks in start_mcp_server
+_process_scan_cache = {}
 
-def stop_mcp_server(verify_with_health_check=True):
+def find_mcp_server_processes(ttl=0):
+    """Find running MCP server processes
+    
+    Args:
+        ttl (float): Reuse the previous scan if it is younger than this many seconds
+            (default 0: always walk the process table, so servers started or stopped
+            since the last call are seen)
+    """
+    import psutil
+    cached = _process_scan_cache.get("scan")
+    if cached and time.monotonic() - cached[0] < ttl:
+        return list(cached[1])
+    
+    mcp_processes = []
+    # Never report the calling process itself (e.g. `python mcp_server.py` checking
+    # for other servers before it starts)
+    own_pid = os.getpid()
+    if sys.platform.startswith('linux'):
+        # Fast path: read /proc/<pid>/cmdline directly and only build Process
+        # objects for the few matches
+        for pid in _find_mcp_server_pids_linux():
+            if pid == own_pid:
+                continue
+            try:
+                mcp_processes.append(psutil.Process(pid))
+            except psutil.NoSuchProcess:
+                continue
+    else:
+        # Only cmdline is requested; proc.pid is always available without a /proc read
+        for proc in psutil.process_iter(['cmdline']):
+            if proc.pid != own_pid and _is_mcp_server_cmdline(proc.info['cmdline']):
+                mcp_processes.append(proc)
+    _process_scan_cache["scan"] = (time.monotonic(), mcp_processes)
+    return list(mcp_processes)
+
+def stop_mcp_server(verify_with_health_check=True, procs=None):
     """Stop any running MCP server processes
     
     Args:
         verify_with_health_check (bool): If True, also check HTTP endpoint to verify server is stopped
+        procs (list): Already-found MCP server processes; if None, the process table is scanned
     """
+    import psutil
     print("🛑 STOPPING MCP SERVER")
     print("=" * 25)
     
-    existing_processes = find_mcp_server_processes()
+    existing_processes = procs if procs is not None else find_mcp_server_processes()
     if existing_processes:
         print(f"🔍 Found {len(existing_processes)} existing MCP server process(es)")
+        # Signal every process first, then wait on the whole group, so several stale
+        # servers cost one timeout in total rather than one each
         for proc in existing_processes:
             try:
                 print(f"🛑 Stopping MCP server (PID: {proc.pid})")
                 proc.terminate()
-                proc.wait(timeout=5)  # Wait up to 5 seconds for graceful termination
-                print(f"✅ Terminated process {proc.pid}")
-            except psutil.TimeoutExpired:
-                print(f"⚠️  Process {proc.pid} didn't terminate gracefully, force killing...")
-                proc.kill()
-                print(f"💀 Force killed process {proc.pid}")
+            except psutil.NoSuchProcess:
+                pass
             except Exception as e:
                 print(f"❌ Error stopping process {proc.pid}: {e}")
+        gone, alive = psutil.wait_procs(existing_processes, timeout=5)  # Up to 5 seconds for graceful termination
+        for proc in gone:
+            print(f"✅ Terminated process {proc.pid}")
         
-        # Optional health check verification
-        if verify_with_health_check:
+        if alive:
+            for proc in alive:
+                try:
+                    print(f"⚠️  Process {proc.pid} didn't terminate gracefully, force killing...")
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+                except Exception as e:
+                    print(f"❌ Error stopping process {proc.pid}: {e}")
+            killed, alive = psutil.wait_procs(alive, timeout=2)
+            for proc in killed:
+                print(f"💀 Force killed process {proc.pid}")
+            for proc in alive:
+                print(f"❌ Process {proc.pid} is still running")
+        # The cached scan now lists stopped processes
+        _process_scan_cache.clear()
+        
+        # Optional health check verification - only needed if something survived;
+        # once wait_procs saw every process exit, their listening sockets are released
+        if verify_with_health_check and not alive:
+            print("✅ All MCP server processes exited - successfully stopped")
+        elif verify_with_health_check:
             time.sleep(2)
-            try:
-                response = requests.get("http://localhost:8765/health", timeout=2)
+            if _http_responds(8765, "/health", timeout=2):
                 print("⚠️  Server might still be running - check manually")
-            except requests.RequestException:
+            else:
                 print("✅ Server is no longer responding - successfully stopped")
     else:
         print("✅ No MCP server processes found - nothing to stop")
@@ -197,7 +334,28 @@ def stop_mcp_server(verify_with_health_check=True):
     print("\n🏁 Stop operation completed!")
 
 
-def start_mcp_server(transport="sse", host="0.0.0.0", port=8765, force_restart=False):
+def _use_uvloop():
+    """Run the server's event loop on uvloop when it is installed
+    
+    uvloop (libuv-based, not available on Windows) speeds up the asyncio loop that
+    uvicorn serves HTTP transports on; uvicorn picks httptools for HTTP parsing by
+    itself when installed. Without uvloop the default asyncio loop is used.
+    
+    Event loop policies are deprecated from Python 3.14 and FastMCP creates the loop
+    itself, so there is no other way in; on 3.14+ the default loop is kept instead
+    of warning on every server start.
+    """
+    if sys.version_info >= (3, 14):
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    import asyncio
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def start_mcp_server(transport="streamable-http", host="0.0.0.0", port=8765, force_restart=False):
     """Start the MCP server with proper port checking.
     
     Args:
@@ -208,12 +366,23 @@ def start_mcp_server(transport="sse", host="0.0.0.0", port=8765, force_restart=F
     """
     print(f"🚀 Starting MCP server with transport={transport} on {host}:{port}")
     
+    # A stdio server talks over its parent's pipes and binds no port, so the port and
+    # process checks below don't apply to it
+    if transport == "stdio":
+        _use_uvloop()
+        mcp.run(transport="stdio")
+        return
+    
+    # One process-table scan shared by the stop and report steps below
+    existing_processes = find_mcp_server_processes()
+    
     # Step 1: Check if port is already in use
     if is_port_in_use(port):
         print(f"\n🔍 Port {port} is already in use!")
         
         # Check if it's an MCP server
-        if is_mcp_server_running(port):
+        # Reuses the scan made just above instead of walking the process table again
+        if is_mcp_server_running(port, ttl=1.0):
             print(f"✅ MCP server is already running on port {port}")
             if not force_restart:
                 print("💡 Use --force-restart flag or stop the existing server first")
@@ -221,7 +390,7 @@ def start_mcp_server(transport="sse", host="0.0.0.0", port=8765, force_restart=F
                 return
             else:
                 print("🔄 Force restart requested - stopping existing server...")
-                stop_mcp_server(verify_with_health_check=False)
+                stop_mcp_server(verify_with_health_check=False, procs=existing_processes)
                 time.sleep(2)
                 
                 # Re-check if port is now free
@@ -249,7 +418,6 @@ def start_mcp_server(transport="sse", host="0.0.0.0", port=8765, force_restart=F
             return
     
     # Step 2: Check if MCP server processes exist (but maybe on different port)
-    existing_processes = find_mcp_server_processes()
     if existing_processes and not force_restart:
         print(f"\n🔍 Found {len(existing_processes)} existing MCP server process(es):")
         for proc in existing_processes:
@@ -259,22 +427,20 @@ def start_mcp_server(transport="sse", host="0.0.0.0", port=8765, force_restart=F
     
     # Step 3: Start the server
     print(f"\n🎯 Starting new MCP server...")
-    if transport == "stdio":
-        mcp.run(transport="stdio")
-    elif transport == "http":
+    _use_uvloop()
+    if transport == "http":
         mcp.run(host=host, port=port, transport="http")
     elif transport == "sse":
         mcp.run(host=host, port=port, transport="sse")
     elif transport == "streamable-http":
         mcp.run(host=host, port=port, transport="streamable-http")
     else:
-        mcp.run(host=host, port=port, transport="sse")  # default fallback
+        mcp.run(host=host, port=port, transport="streamable-http")  # default fallback
 
 
 def start_demo_server_background():
     """Start MCP server in background for demo purposes."""
     import subprocess
-    import time
     
     print("🔧 MCP SERVER STARTUP PROCESS")
     print("=" * 35)
@@ -288,79 +454,72 @@ def start_demo_server_background():
     # Use the virtual environment Python if available, otherwise python3
     python_cmd = ".venv/bin/python" if os.path.exists(".venv/bin/python") else "python3"
     server_process = subprocess.Popen(
-        [python_cmd, "mcp_server.py", "sse", "8765"],
+        [python_cmd, "mcp_server.py", "streamable-http", "8765"],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True
     )
     
-    # Wait for server to start
+    # Wait for server to start - probe the port with exponential backoff instead of
+    # fixed sleeps, so we return as soon as the server accepts connections
     print("⏳ Waiting for server to start...")
-    time.sleep(3)
-    
-    # Check if server is running
-    max_retries = 5
-    for retry in range(max_retries):
-        try:
-            response = requests.get("http://localhost:8765/health", timeout=2)
-            if response.status_code == 200:
+    deadline = time.monotonic() + 10
+    delay = 0.05
+    while time.monotonic() < deadline:
+        if server_process.poll() is not None:
+            print(f"❌ MCP server exited during startup (exit code {server_process.returncode})")
+            return server_process
+        if is_port_in_use(8765):
+            # Port is bound - one quick request confirms the HTTP app is serving
+            if _http_responds(8765):
                 print("✅ MCP server is running on http://localhost:8765")
                 print(f"📊 Server PID: {server_process.pid}")
                 return server_process
-        except requests.RequestException:
-            if retry < max_retries - 1:
-                print(f"⏳ Retry {retry + 1}/{max_retries}...")
-                time.sleep(2)
-            else:
-                print("⚠️  Server might still be starting... continuing anyway")
-                print(f"📊 Server PID: {server_process.pid}")
-                return server_process
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
     
-    print("\n✅ MCP server startup completed!")
-    print(f"🌐 Server available at: http://localhost:8765")
-    print(f"📊 Process ID: {server_process.pid}")
+    print("⚠️  Server might still be starting... continuing anyway")
+    print(f"📊 Server PID: {server_process.pid}")
     return server_process
 
 if __name__ == "__main__":
+    import argparse
+    
     # Parse command line arguments
-    transport = "sse"
-    port = 8765
-    host = "0.0.0.0"
-    force_restart = False
+    parser = argparse.ArgumentParser(
+        description="🚀 MCP Server",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""Examples:
+  python mcp_server.py                    # Start with defaults
+  python mcp_server.py sse 8080           # Start on port 8080
+  python mcp_server.py 8080               # Default transport on port 8080
+  python mcp_server.py --force-restart    # Force restart existing servers
+  python mcp_server.py http 9000 --host localhost"""
+    )
+    transports = ["sse", "http", "stdio", "streamable-http"]
+    parser.add_argument("transport", nargs="?",
+                        help=f"Transport type: {', '.join(transports)} (default: streamable-http)")
+    parser.add_argument("port", nargs="?",
+                        help="Port number (default: 8765)")
+    parser.add_argument("--host", default="0.0.0.0",
+                        help="Host to bind to (default: 0.0.0.0)")
+    parser.add_argument("--force-restart", action="store_true",
+                        help="Stop existing servers and start new one")
+    args = parser.parse_args()
+    host, force_restart = args.host, args.force_restart
     
-    # Parse arguments
-    args = sys.argv[1:]
-    i = 0
-    while i < len(args):
-        if args[i] in ["sse", "http", "stdio", "streamable-http"]:
-            transport = args[i]
-        elif args[i].isdigit():
-            port = int(args[i])
-        elif args[i] == "--force-restart":
-            force_restart = True
-        elif args[i] == "--host" and i + 1 < len(args):
-            host = args[i + 1]
-            i += 1
-        elif args[i] == "--help":
-            print("🚀 MCP Server Usage:")
-            print("  python mcp_server.py [transport] [port] [options]")
-            print()
-            print("Arguments:")
-            print("  transport     Transport type: sse, http, stdio, streamable-http (default: sse)")
-            print("  port          Port number (default: 8765)")
-            print()
-            print("Options:")
-            print("  --host HOST   Host to bind to (default: 0.0.0.0)")
-            print("  --force-restart  Stop existing servers and start new one")
-            print("  --help        Show this help message")
-            print()
-            print("Examples:")
-            print("  python mcp_server.py                    # Start with defaults")
-            print("  python mcp_server.py sse 8080           # Start on port 8080")
-            print("  python mcp_server.py --force-restart    # Force restart existing servers")
-            print("  python mcp_server.py http 9000 --host localhost")
-            sys.exit(0)
-        i += 1
+    # Transport and port may be given alone or in either order (`8080`, `8080 sse`)
+    transport, port = "streamable-http", 8765
+    for value in (args.transport, args.port):
+        if value is None:
+            continue
+        if value.isdigit():
+            port = int(value)
+        elif value in transports:
+            transport = value
+        else:
+            parser.error(f"invalid transport or port: {value!r} "
+                         f"(transport must be one of: {', '.join(transports)})")
     
     print(f"🎯 MCP Server Configuration:")
     print(f"   Transport: {transport}")
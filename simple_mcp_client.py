@@ -38,11 +38,11 @@ async def simple_mcp_client_demo():
     print("=" * 50)
     
     # MCP Client URL Options based on server transport:
-    # - SSE (current):           Client("http://localhost:8765/sse")
+    # - SSE:                     Client("http://localhost:8765/sse")
     # - HTTP:                    Client("http://localhost:8765")
-    # - Streamable HTTP:         Client("http://localhost:8765/stream")
+    # - Streamable HTTP (current): Client("http://localhost:8765/mcp")
     # - STDIO:                   Client("mcp_server.py") - simple file path syntax
-    client = Client("http://localhost:8765/sse")
+    client = Client("http://localhost:8765/mcp")
     async with client:
         # 1. Server Health Check & Connection Status
         print("\nSERVER CONNECTIVITY:")
@@ -50,54 +50,64 @@ async def simple_mcp_client_demo():
         try:
             ping_result = await client.ping()
             print("Server ping successful!")
-            
-            # Show connection status
-            is_connected = client.is_connected()
-            print(f"Connection status: {'Connected' if is_connected else 'Disconnected'}")
         except Exception as e:
+            # Some server/transport combinations (e.g. Streamable HTTP on newer fastmcp)
+            # answer ping with "Method not found" - the server still replied, so only
+            # a lost connection ends the demo
             print(f"Server ping failed: {e}")
+        
+        # Show connection status
+        is_connected = client.is_connected()
+        print(f"Connection status: {'Connected' if is_connected else 'Disconnected'}")
+        if not is_connected:
             return
         
         # 2. Complete Discovery via MCP Protocol
         print("\nDISCOVERY - ALL AVAILABLE FEATURES:")
         print("=" * 45)
         
+        # Independent discovery requests - issue them concurrently, once; the later
+        # sections reuse these results rather than listing again
+        tools, resources, prompts = await asyncio.gather(
+            client.list_tools(),
+            client.list_resources(),
+            client.list_prompts(),
+            return_exceptions=True
+        )
+        
         # Tools discovery
         print("\nAvailable Tools:")
-        tools = await client.list_tools()
+        if isinstance(tools, Exception):
+            raise tools
         print(f"Found {len(tools)} tools:")
         for tool in tools:
             print(f"  - {tool.name}: {tool.description}")
         
         # Resources discovery
         print("\nAvailable Resources:")
-        try:
-            resources = await client.list_resources()
-            if resources:
-                print(f"Found {len(resources)} resources:")
-                for resource in resources:
-                    print(f"  - {resource.uri}: {resource.name}")
-                    print(f"    Description: {resource.description}")
-            else:
-                print("  No resources available")
-        except Exception as e:
-            print(f"  No resources available: {e}")
+        if isinstance(resources, Exception):
+            print(f"  No resources available: {resources}")
+        elif resources:
+            print(f"Found {len(resources)} resources:")
+            for resource in resources:
+                print(f"  - {resource.uri}: {resource.name}")
+                print(f"    Description: {resource.description}")
+        else:
+            print("  No resources available")
         
         # Prompts discovery
         print("\nAvailable Prompts:")
-        try:
-            prompts = await client.list_prompts()
-            if prompts:
-                print(f"Found {len(prompts)} prompts:")
-                for prompt in prompts:
-                    print(f"  - {prompt.name}: {prompt.description}")
-                    if hasattr(prompt, 'arguments') and prompt.arguments:
-                        args = [arg.name for arg in prompt.arguments]
-                        print(f"    Parameters: {args}")
-            else:
-                print("  No prompts available")
-        except Exception as e:
-            print(f"  No prompts available: {e}")
+        if isinstance(prompts, Exception):
+            print(f"  No prompts available: {prompts}")
+        elif prompts:
+            print(f"Found {len(prompts)} prompts:")
+            for prompt in prompts:
+                print(f"  - {prompt.name}: {prompt.description}")
+                if hasattr(prompt, 'arguments') and prompt.arguments:
+                    args = [arg.name for arg in prompt.arguments]
+                    print(f"    Parameters: {args}")
+        else:
+            print("  No prompts available")
         
         # 3. Show MCP Tool Syntax and Parameters
         print("\nMCP TOOL SYNTAX & PARAMETERS:")
@@ -115,46 +125,67 @@ async def simple_mcp_client_demo():
         print("\nEXECUTING MCP TOOLS:")
         print("=" * 30)
         
+        # Identical calls within this session share one request: the in-flight task is
+        # cached, so even concurrent duplicates only reach the server once
+        call_cache = {}
+        
+        def cached_call_tool(name, args):
+            key = (name, json.dumps(args, sort_keys=True))
+            task = call_cache.get(key)
+            if task is None:
+                task = asyncio.ensure_future(client.call_tool(name, args))
+                call_cache[key] = task
+            return task
+        
+        # The calls are independent - send them together and print results in order
+        weather_result, calc_result, calc_result2, user_result = await asyncio.gather(
+            cached_call_tool("get_weather", {"city": "London"}),
+            cached_call_tool("calculate", {"operation": "multiply", "a": 15, "b": 4}),
+            cached_call_tool("calculate", {"operation": "multiply", "a": 15, "b": 4}),
+            cached_call_tool("get_user_info", {"user_id": 1})
+        )
+        
         print("\nCalling get_weather tool...")
-        weather_result = await client.call_tool("get_weather", {"city": "London"})
         print(f"Result: {weather_result.structured_content}")
         
         print("\nCalling calculate tool...")
-        calc_result = await client.call_tool("calculate", {"operation": "multiply", "a": 15, "b": 4})
         print(f"Result: {calc_result.structured_content}")
         
-        print("\nCalling calculate tool...")
-        calc_result = await client.call_tool("calculate", {"operation": "multiply", "a": 15, "b": 4})
-        print(f"Result: {calc_result.structured_content}")
+        print("\nCalling calculate tool again (same arguments - served from cache)...")
+        print(f"Result: {calc_result2.structured_content}")
         
         print("\nCalling get_user_info tool...")
-        user_result = await client.call_tool("get_user_info", {"user_id": 1})
         print(f"Result: {user_result.structured_content}")
         
         # 5. Read Resources via MCP Protocol
         print("\nREADING MCP RESOURCES:")
         print("=" * 30)
         try:
-            resources = await client.list_resources()
+            # Reuse the resource list from discovery instead of asking the server again
+            if isinstance(resources, Exception):
+                raise resources
             if resources:
                 print(f"\nReading content from {len(resources)} resources:")
-                for resource in resources[:3]:  # Read first 3 resources to avoid spam
-                    try:
-                        print(f"\nReading resource: {resource.uri}")
-                        content = await client.read_resource(resource.uri)
-                        if content and len(content) > 0:
-                            # Handle different content types safely
-                            try:
-                                text_content = str(content[0])
-                                # Show preview of content
-                                preview = text_content[:200] + "..." if len(text_content) > 200 else text_content
-                                print(f"Content preview: {preview}")
-                            except Exception:
-                                print(f"Content: [Available but not displayable as text]")
-                        else:
-                            print("Content: [Empty]")
-                    except Exception as e:
-                        print(f"Error reading {resource.uri}: {e}")
+                to_read = resources[:3]  # Read first 3 resources to avoid spam
+                contents = await asyncio.gather(
+                    *(client.read_resource(resource.uri) for resource in to_read),
+                    return_exceptions=True
+                )
+                for resource, content in zip(to_read, contents):
+                    print(f"\nReading resource: {resource.uri}")
+                    if isinstance(content, Exception):
+                        print(f"Error reading {resource.uri}: {content}")
+                    elif content and len(content) > 0:
+                        # Handle different content types safely
+                        try:
+                            text_content = str(content[0])
+                            # Show preview of content
+                            preview = text_content[:200] + "..." if len(text_content) > 200 else text_content
+                            print(f"Content preview: {preview}")
+                        except Exception:
+                            print(f"Content: [Available but not displayable as text]")
+                    else:
+                        print("Content: [Empty]")
             else:
                 print("No resources available to read")
         except Exception as e:
@@ -164,7 +195,9 @@ async def simple_mcp_client_demo():
         print("\nGENERATING FROM PROMPT TEMPLATES:")
         print("=" * 40)
         try:
-            prompts = await client.list_prompts()
+            # Reuse the prompt list from discovery instead of asking the server again
+            if isinstance(prompts, Exception):
+                raise prompts
             if prompts:
                 print(f"\nGenerating content from {len(prompts)} prompt templates:")
                 for prompt in prompts[:3]:  # Use first 3 prompts
@@ -215,16 +248,5 @@ def main():
     asyncio.run(simple_mcp_client_demo())
 
 
-# Check for interactive environment FIRST, before the __name__ check
-try:
-    # Check if we're in an interactive environment with a running event loop
-    loop = asyncio.get_running_loop()
-    if loop and loop.is_running():
-        print("VS Code Interactive mode detected!")
-        print("Running MCP demo...")
-        # Use create_task to run in the existing event loop
-        demo_task = asyncio.create_task(simple_mcp_client_demo())
-except RuntimeError:
-    # No event loop running - safe to use the standard script approach
-    if __name__ == "__main__":
-        main()
+if __name__ == "__main__":
+    main()